@@ -1,4 +1,5 @@
 use anyhow::anyhow;
+use std::sync::OnceLock;
 
 pub fn hash_password(plain: &str) -> anyhow::Result<String> {
     use argon2::{password_hash::SaltString, Argon2, PasswordHasher};
@@ -26,3 +27,13 @@ pub fn verify_password(hash: &str, plain: &str) -> anyhow::Result<bool> {
         .verify_password(plain.as_bytes(), &parsed)
         .is_ok())
 }
+
+/// Argon2 hash of a random password, used to burn the same verify time
+/// for unknown usernames as for known ones. Warmed in the background at
+/// startup so the first unknown-username login doesn't also pay for hashing.
+pub fn dummy_hash() -> &'static str {
+    static DUMMY: OnceLock<String> = OnceLock::new();
+    DUMMY.get_or_init(|| {
+        hash_password(&uuid::Uuid::new_v4().to_string()).expect("argon2 dummy hash")
+    })
+}
@@ -1,5 +1,6 @@
 use anyhow::Result;
-use mongodb::{options::ClientOptions, Client, Database};
+use std::time::Duration;
+use mongodb::{options::ClientOptions, Client, Database, IndexModel};
 use mongodb::bson::doc;
 use mongodb::Collection;
 use tokio::sync::mpsc::UnboundedSender;
@@ -15,61 +16,58 @@ pub async fn connect(uri: &str) -> Result<Db> {
     if opts.app_name.is_none() {
         opts.app_name = Some("BestellDesk".into());
     }
+    // Pool defaults for one desktop process; values given in the URI win.
+    // Keep a few warm connections so UI clicks don't pay a new TLS handshake.
+    if opts.max_pool_size.is_none() {
+        opts.max_pool_size = Some(10);
+    }
+    if opts.min_pool_size.is_none() {
+        opts.min_pool_size = Some(2);
+    }
+    if opts.max_idle_time.is_none() {
+        opts.max_idle_time = Some(Duration::from_secs(300));
+    }
+    if opts.server_selection_timeout.is_none() {
+        opts.server_selection_timeout = Some(Duration::from_secs(5));
+    }
     let client = Client::with_options(opts)?;
     let db = client
         .default_database()
         .unwrap_or_else(|| client.database("bestelldesk"));
     db.run_command(doc! { "ping": 1 }).await?;
-    Ok(Db { _client: client, db })
+    let dbh = Db { _client: client, db };
+    ensure_indexes(&dbh).await;
+    Ok(dbh)
 }
 
-impl Db {
-    pub fn collection<T: Send + Sync>(&self, name: &str) -> Collection<T> {
-        self.db.collection::<T>(name)
+/// Indexes for the filters used by the services (all lookups go by
+/// supplier or username). create_index is a no-op if the index exists.
+pub async fn ensure_indexes(db: &Db) {
+    let specs = [
+        ("dishes", doc! { "supplier_id": 1 }),
+        ("categories", doc! { "supplier_id": 1, "position": 1 }),
+        ("orders", doc! { "supplier_id": 1, "created_at": -1 }),
+        ("admin_users", doc! { "username": 1 }),
+    ];
+    for (name, keys) in specs {
+        let model = IndexModel::builder().keys(keys).build();
+        if let Err(e) = db.collection::<mongodb::bson::Document>(name).create_index(model).await {
+            // fehlende Rechte o.ä. soll den Connect nicht verhindern
+            tracing::warn!("create_index on {name} failed: {e}");
+        }
     }
 }
 
-pub async fn watch_settings(db: Db, tx: UnboundedSender<crate::AppMsg>) {
-    let coll = db.collection::<crate::model::AppSettings>("settings");
-    let mut stream = match coll.watch().await {
-        Ok(s) => s,
-        Err(_) => return,
-    };
-    while let Some(_ev) =
-        futures_util::TryStreamExt::try_next(&mut stream).await.ok().flatten()
-    {
-        let _ = tx.send(crate::AppMsg::SettingsChanged);
-    }
-}
-
-pub async fn watch_suppliers(db: Db, tx: UnboundedSender<crate::AppMsg>) {
-    let coll = db.collection::<crate::model::Supplier>("suppliers");
-    let mut stream = match coll.watch().await {
-        Ok(s) => s,
-        Err(_) => return,
-    };
-    while let Some(_ev) =
-        futures_util::TryStreamExt::try_next(&mut stream).await.ok().flatten()
-    {
-        let _ = tx.send(crate::AppMsg::SuppliersChanged);
-    }
-}
-
-pub async fn watch_dishes(db: Db, tx: UnboundedSender<crate::AppMsg>) {
-    let coll = db.collection::<crate::model::Dish>("dishes");
-    let mut stream = match coll.watch().await {
-        Ok(s) => s,
-        Err(_) => return,
-    };
-    while let Some(_ev) =
-        futures_util::TryStreamExt::try_next(&mut stream).await.ok().flatten()
-    {
-        let _ = tx.send(crate::AppMsg::DishesChanged);
+impl Db {
+    pub fn collection<T: Send + Sync>(&self, name: &str) -> Collection<T> {
+        self.db.collection::<T>(name)
     }
 }
 
-pub async fn watch_orders(db: Db, tx: UnboundedSender<crate::AppMsg>) {
-    let coll = db.collection::<crate::model::Order>("orders");
+/// Forward every change event of `name` to the UI as `msg`.
+/// Ends silently if change streams are unavailable (e.g. standalone server).
+pub async fn watch(db: Db, name: &'static str, msg: crate::AppMsg, tx: UnboundedSender<crate::AppMsg>) {
+    let coll = db.collection::<mongodb::bson::Document>(name);
     let mut stream = match coll.watch().await {
         Ok(s) => s,
         Err(_) => return,
@@ -77,6 +75,6 @@ pub async fn watch_orders(db: Db, tx: UnboundedSender<crate::AppMsg>) {
     while let Some(_ev) =
         futures_util::TryStreamExt::try_next(&mut stream).await.ok().flatten()
     {
-        let _ = tx.send(crate::AppMsg::OrdersChanged);
+        let _ = tx.send(msg);
     }
 }
@@ -14,6 +14,7 @@ use crate::services::updater;
 
 const GH_OWNER: &str = "enzel-org";
 const GH_REPO:  &str = "BestellDesk";
+const RT_WORKER_THREADS: usize = 2;
 
 #[derive(Default)]
 struct BestellDeskState {
@@ -53,6 +54,7 @@ struct BestellDesk {
     client_id: String,
 }
 
+#[derive(Clone, Copy)]
 enum AppMsg {
     SettingsChanged,
     SuppliersChanged,
@@ -72,7 +74,22 @@ impl Default for BestellDesk {
         let server_input = cfg.mongo_uri.clone().unwrap_or_default();
         let agent_host  = cfg.agent_host.clone().unwrap_or_default();
 
-        let rt = Arc::new(Runtime::new().expect("tokio runtime"));
+        // Nur I/O (Watcher, Mongo-Pool, HTTP): wenige Worker reichen,
+        // statt einem pro CPU-Kern wie bei Runtime::new()
+        let rt = Arc::new(
+            tokio::runtime::Builder::new_multi_thread()
+                .worker_threads(RT_WORKER_THREADS)
+                .thread_name("bestelldesk-rt")
+                .enable_all()
+                .build()
+                .expect("tokio runtime"),
+        );
+
+        // Dummy-Hash für Logins mit unbekanntem User vorab erzeugen,
+        // im Hintergrund statt auf dem UI-Thread
+        rt.spawn_blocking(|| {
+            auth::dummy_hash();
+        });
 
         // --- Update check at startup ---
         let current_ver = env!("CARGO_PKG_VERSION").to_string();
@@ -256,14 +273,14 @@ impl App for BestellDesk {
 
                             // Spawn watchers...
                             let (tx, rx) = mpsc::unbounded_channel::<AppMsg>();
-                            let db_clone = dbh.clone();
-                            self.rt.spawn(db::watch_settings(db_clone.clone(), tx.clone()));
-                            let db_clone = dbh.clone();
-                            self.rt.spawn(db::watch_suppliers(db_clone.clone(), tx.clone()));
-                            let db_clone = dbh.clone();
-                            self.rt.spawn(db::watch_dishes(db_clone.clone(), tx.clone()));
-                            let db_clone = dbh.clone();
-                            self.rt.spawn(db::watch_orders(db_clone, tx.clone()));
+                            for (name, msg) in [
+                                ("settings", AppMsg::SettingsChanged),
+                                ("suppliers", AppMsg::SuppliersChanged),
+                                ("dishes", AppMsg::DishesChanged),
+                                ("orders", AppMsg::OrdersChanged),
+                            ] {
+                                self.rt.spawn(db::watch(dbh.clone(), name, msg, tx.clone()));
+                            }
 
                             self.db = Some(dbh);
                             self.rx = Some(rx);
@@ -296,6 +313,7 @@ impl App for BestellDesk {
             while let Ok(msg) = rx.try_recv() {
                 match msg {
                     AppMsg::SettingsChanged => {
+                        self.state.admin_state.active_supplier_at = None;
                         self.state.order_state.loaded = false;
                         self.state.order_state.load_err = None;
                     }
@@ -48,6 +48,21 @@ pub struct Dish {
     pub categories: Vec<ObjectId>,
 }
 
+impl Dish {
+    /// Numeric value of the menu number ("12a" -> 12), used for sorting.
+    /// Parses the digits in place instead of collecting them into a String.
+    pub fn number_key(&self) -> Option<i64> {
+        let nr = self.number.as_deref()?;
+        let mut seen = false;
+        let mut v: i64 = 0;
+        for c in nr.chars().filter(|c| c.is_ascii_digit()) {
+            seen = true;
+            v = v.checked_mul(10)?.checked_add((c as u8 - b'0') as i64)?;
+        }
+        seen.then_some(v)
+    }
+}
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct DishInput {
     pub supplier_id: ObjectId,
@@ -68,9 +83,9 @@ pub struct OrderItem {
 
     #[serde(default)]
     pub line_total_cents: i64,
-    #[serde(default)]
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub note: Option<String>,
-    #[serde(default)]
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub variant: Option<String>,
 }
 
@@ -84,6 +99,9 @@ pub struct Order {
     pub order_code: String,
 
     pub supplier_id: ObjectId,
+    // Snapshot beim Bestellen; spätere Umbenennungen ändern ältere Orders nicht
+    #[serde(default)]
+    pub supplier_name: Option<String>,
     pub items: Vec<OrderItem>,
 
     pub delivery_fee_cents: i64,
@@ -93,9 +111,9 @@ pub struct Order {
     pub status: String,
     pub created_at: DateTime,
 
-    #[serde(default)]
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub paid_cents: Option<i64>,
-    #[serde(default)]
+    #[serde(default, skip_serializing_if = "Option::is_none")]
     pub completed: Option<bool>,
 }
 
@@ -30,6 +30,8 @@ pub async fn verify(db: &Db, user: &str, pass: &str) -> Result<bool> {
     if let Some(u) = coll(db).find_one(doc! { "username": user }).await? {
         Ok(auth::verify_password(&u.password_hash, pass)?)
     } else {
+        // gleicher Argon2-Aufwand wie bei existierendem User -> kein Timing-Leak
+        let _ = auth::verify_password(auth::dummy_hash(), pass);
         Ok(false)
     }
 }
@@ -3,13 +3,16 @@ use aes_gcm::{Aes256Gcm, KeyInit, aead::{Aead, Key, generic_array::GenericArray}
 use argon2::{Argon2, Algorithm, Params, Version};
 use base64::{engine::general_purpose::STANDARD as B64, Engine as _};
 use futures_util::TryStreamExt;
-use mongodb::bson::{doc, DateTime, Document};
+use mongodb::bson::{self, doc, DateTime, Document};
 
 use crate::db::Db;
 use std::collections::BTreeMap;
 
 /* ---------- Datenstrukturen ---------- */
 
+// v1: Klartext ist JSON (serde_json), v2: Klartext ist BSON
+const FORMAT_VERSION: u32 = 2;
+
 #[derive(serde::Serialize, serde::Deserialize)]
 struct Meta {
     created_at: DateTime,
@@ -48,6 +51,20 @@ async fn dump_collection(db: &Db, name: &str) -> Result<Vec<Document>> {
     Ok(out)
 }
 
+fn encode_payload(data: &BackupData) -> Result<Vec<u8>> {
+    // BSON statt JSON: Documents werden ohne Umweg über Extended JSON
+    // serialisiert (schneller, verlustfrei)
+    bson::to_vec(data).context("serialize backup bson")
+}
+
+fn decode_payload(version: u32, pt: &[u8]) -> Result<BackupData> {
+    match version {
+        1 => serde_json::from_slice(pt).context("parse backup json"),
+        2 => bson::from_slice(pt).context("parse backup bson"),
+        v => anyhow::bail!("Unsupported backup version {v}"),
+    }
+}
+
 fn encrypt(password: &str, plaintext: &[u8]) -> Result<EncBlob> {
     // Argon2id Key-Derivation
     let m_cost = 19_456; // KiB
@@ -77,7 +94,7 @@ fn encrypt(password: &str, plaintext: &[u8]) -> Result<EncBlob> {
         .map_err(|_e| anyhow::anyhow!("aes-gcm encrypt failed"))?;
 
     Ok(EncBlob {
-        version: 1,
+        version: FORMAT_VERSION,
         kdf: "argon2id".into(),
         m_cost,
         t_cost,
@@ -146,13 +163,13 @@ pub async fn export_to_file(db: &Db, path: &str, password: &str) -> Result<()> {
         meta: Meta {
             created_at: DateTime::now(),
             app: "BestellDesk".into(),
-            version: 1,
+            version: FORMAT_VERSION,
         },
         collections: map,
     };
 
-    let json = serde_json::to_vec(&data).context("serialize backup json")?;
-    let enc = encrypt(password, &json)?;
+    let payload = encode_payload(&data)?;
+    let enc = encrypt(password, &payload)?;
     let blob = serde_json::to_vec_pretty(&enc).context("serialize enc blob")?;
 
     // Sync I/O reicht hier; vermeidet zusätzliche Tokio-Features
@@ -164,17 +181,105 @@ pub async fn import_from_file(db: &Db, path: &str, password: &str) -> Result<()>
     let bytes = std::fs::read(path).context("read file")?;
     let enc: EncBlob = serde_json::from_slice(&bytes).context("parse enc blob")?;
     let pt = decrypt(password, &enc).context("decrypt")?;
-    let data: BackupData = serde_json::from_slice(&pt).context("parse backup json")?;
+    let data = decode_payload(enc.version, &pt)?;
 
     // Replace all: drop + insert_many
-    for (name, docs) in data.collections {
-        let _ = db.db.run_command(doc! { "drop": &name }).await; // ignorieren, wenn es die Collection (noch) nicht gibt
-        if !docs.is_empty() {
-            let coll = db.db.collection::<Document>(&name);
-            coll.insert_many(docs)
-                .await
-                .with_context(|| format!("insert_many into {}", name))?;
+    let res: Result<()> = async {
+        for (name, docs) in data.collections {
+            let _ = db.db.run_command(doc! { "drop": &name }).await; // ignorieren, wenn es die Collection (noch) nicht gibt
+            if !docs.is_empty() {
+                let coll = db.db.collection::<Document>(&name);
+                // unordered: Server darf die Batches ohne Reihenfolge-Garantie schreiben
+                coll.insert_many(docs)
+                    .ordered(false)
+                    .await
+                    .with_context(|| format!("insert_many into {}", name))?;
+            }
         }
+        Ok(())
+    }
+    .await;
+    // drop hat auch die Indexe entfernt – auch nach einem Fehler neu anlegen
+    crate::db::ensure_indexes(db).await;
+    res
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use mongodb::bson::oid::ObjectId;
+
+    fn sample() -> BackupData {
+        let mut collections = BTreeMap::new();
+        collections.insert(
+            "orders".to_string(),
+            vec![doc! {
+                "_id": ObjectId::parse_str("650000000000000000000001").unwrap(),
+                "customer_name": "Anna",
+                "created_at": DateTime::from_millis(1_700_000_000_000),
+                "grand_total_cents": 1250_i64,
+            }],
+        );
+        BackupData {
+            meta: Meta {
+                created_at: DateTime::from_millis(1_700_000_000_000),
+                app: "BestellDesk".into(),
+                version: FORMAT_VERSION,
+            },
+            collections,
+        }
+    }
+
+    #[test]
+    fn v2_payload_roundtrips() {
+        let data = sample();
+        let bytes = encode_payload(&data).unwrap();
+        let back = decode_payload(FORMAT_VERSION, &bytes).unwrap();
+
+        assert_eq!(back.meta.created_at, data.meta.created_at);
+        assert_eq!(back.meta.app, data.meta.app);
+        assert_eq!(back.meta.version, data.meta.version);
+        assert_eq!(back.collections, data.collections);
+
+        let order = &back.collections["orders"][0];
+        assert!(order.get_object_id("_id").is_ok());
+        assert!(order.get_datetime("created_at").is_ok());
+    }
+
+    #[test]
+    fn v1_json_payload_still_decodes() {
+        // Klartext wie ihn v0.7.1 und älter geschrieben haben
+        let json = br#"{
+            "meta": {
+                "created_at": { "$date": { "$numberLong": "1700000000000" } },
+                "app": "BestellDesk",
+                "version": 1
+            },
+            "collections": {
+                "orders": [{
+                    "_id": { "$oid": "650000000000000000000001" },
+                    "customer_name": "Anna",
+                    "created_at": { "$date": { "$numberLong": "1700000000000" } }
+                }]
+            }
+        }"#;
+        let data = decode_payload(1, json).unwrap();
+
+        assert_eq!(data.meta.version, 1);
+        assert_eq!(data.meta.created_at, DateTime::from_millis(1_700_000_000_000));
+        let order = &data.collections["orders"][0];
+        assert_eq!(
+            order.get_object_id("_id").unwrap(),
+            ObjectId::parse_str("650000000000000000000001").unwrap()
+        );
+        assert_eq!(
+            *order.get_datetime("created_at").unwrap(),
+            DateTime::from_millis(1_700_000_000_000)
+        );
+    }
+
+    #[test]
+    fn unknown_version_is_rejected() {
+        assert!(decode_payload(99, b"").is_err());
     }
-    Ok(())
 }
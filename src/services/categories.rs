@@ -23,8 +23,13 @@ pub async fn list_by_supplier(db: &Db, supplier_id: ObjectId) -> Result<Vec<Cate
 }
 
 pub async fn create(db: &Db, supplier_id: ObjectId, name: &str) -> Result<ObjectId> {
-    let list = list_by_supplier(db, supplier_id).await?;
-    let pos = list.last().map(|c| c.position + 1).unwrap_or(0);
+    // nur die höchste Position holen statt alle Kategorien zu laden
+    let pos = coll(db)
+        .find_one(doc! { "supplier_id": supplier_id })
+        .sort(doc! { "position": -1 })
+        .await?
+        .map(|c| c.position + 1)
+        .unwrap_or(0);
     let c = Category {
         id: None,
         supplier_id,
@@ -1,26 +1,31 @@
 use anyhow::Result;
 use futures_util::TryStreamExt;
-use mongodb::bson::{doc, oid::ObjectId, DateTime, Document};
+use mongodb::bson::{doc, oid::ObjectId, DateTime};
 use mongodb::Collection;
 
 use crate::db::Db;
-use crate::model::Order;
+use crate::model::{Order, OrderItem};
 
 fn coll(db: &Db) -> Collection<Order> {
     db.collection::<Order>("orders")
 }
 
-pub async fn list_by_supplier(db: &Db, supplier_id: ObjectId) -> Result<Vec<Order>> {
+/// Orders of a supplier (newest first) plus the sum over all of them.
+/// Sorted server-side so the (supplier_id, created_at) index serves it;
+/// the total is summed once here instead of on every frame in the UI.
+pub async fn list_with_total(db: &Db, supplier_id: ObjectId) -> Result<(Vec<Order>, i64)> {
     let mut cur = coll(db)
         .find(doc! { "supplier_id": supplier_id })
+        .sort(doc! { "created_at": -1 })
         .await?;
     let mut out = Vec::new();
+    let mut total: i64 = 0;
     while let Some(o) = cur.try_next().await? {
+        // gleiche Formel wie in der UI: Items + Delivery
+        total += o.items.iter().map(|it| it.line_total_cents).sum::<i64>() + o.delivery_fee_cents;
         out.push(o);
     }
-    // created_at DESC (DateTime ist NICHT Option)
-    out.sort_by_key(|o| std::cmp::Reverse(o.created_at.timestamp_millis()));
-    Ok(out)
+    Ok((out, total))
 }
 
 pub async fn set_paid_cents(db: &Db, id: ObjectId, paid_cents: i64, completed: bool) -> Result<()> {
@@ -33,8 +38,10 @@ pub async fn set_paid_cents(db: &Db, id: ObjectId, paid_cents: i64, completed: b
     Ok(())
 }
 
-pub async fn delete(db: &Db, id: ObjectId) -> Result<()> {
-    coll(db).delete_one(doc! { "_id": id }).await?;
+pub async fn delete_many(db: &Db, ids: &[ObjectId]) -> Result<()> {
+    coll(db)
+        .delete_many(doc! { "_id": { "$in": ids.to_vec() } })
+        .await?;
     Ok(())
 }
 
@@ -42,48 +49,43 @@ pub async fn create_with_notes(
     db: &Db,
     customer_name: &str,
     supplier_id: ObjectId,
-    items: Vec<(ObjectId, String, i32, i64, Option<String>, Option<String>)>,
+    supplier_name: &str,
+    mut items: Vec<OrderItem>,
     delivery_fee_cents: i64,
     client_id: &str,
 ) -> Result<ObjectId> {
-    let code = nanoid::nanoid!(8);
+    anyhow::ensure!(!customer_name.trim().is_empty(), "Customer name is required");
+    anyhow::ensure!(!items.is_empty(), "Order has no items");
 
-    let items_docs: Vec<Document> = items
-        .iter()
-        .map(|(dish_id, name, qty, unit, note, variant)| {
-            let mut d = doc! {
-                "dish_id": dish_id,
-                "name": name,
-                "qty": qty,
-                "unit_price_cents": unit,
-                "line_total_cents": (unit * (*qty as i64)),
-            };
-            if let Some(n) = note { if !n.trim().is_empty() { d.insert("note", n); } }
-            if let Some(v) = variant { d.insert("variant", v); }
-            d
-        })
-        .collect();
-
-    let items_total_cents: i64 = items_docs
-        .iter()
-        .map(|d| d.get_i64("line_total_cents").unwrap_or(0))
-        .sum();
+    // Zeilensumme und leere Notizen hier normalisieren, nicht dem Aufrufer überlassen
+    for it in &mut items {
+        anyhow::ensure!(it.qty > 0, "Invalid quantity for {}", it.name);
+        it.line_total_cents = it.unit_price_cents * (it.qty as i64);
+        if it.note.as_deref().is_some_and(|n| n.trim().is_empty()) {
+            it.note = None;
+        }
+    }
 
+    let items_total_cents: i64 = items.iter().map(|it| it.line_total_cents).sum();
     let grand_total_cents = items_total_cents + delivery_fee_cents;
 
-    let order_doc = doc! {
-        "customer_name": customer_name,
-        "client_id": client_id,
-        "order_code": code,
-        "supplier_id": supplier_id,
-        "items": items_docs,
-        "delivery_fee_cents": delivery_fee_cents,
-        "items_total_cents": items_total_cents,
-        "grand_total_cents": grand_total_cents,
-        "created_at": DateTime::now(),
-        "status": "new",
+    let order = Order {
+        id: None,
+        customer_name: customer_name.to_string(),
+        client_id: client_id.to_string(),
+        order_code: nanoid::nanoid!(8),
+        supplier_id,
+        supplier_name: Some(supplier_name.to_string()),
+        items,
+        delivery_fee_cents,
+        items_total_cents,
+        grand_total_cents,
+        status: "new".into(),
+        created_at: DateTime::now(),
+        paid_cents: None,
+        completed: None,
     };
 
-    let r = db.collection::<mongodb::bson::Document>("orders").insert_one(order_doc).await?;
+    let r = coll(db).insert_one(order).await?;
     Ok(r.inserted_id.as_object_id().unwrap())
 }
@@ -1,6 +1,8 @@
 use eframe::egui;
 use mongodb::bson::oid::ObjectId;
+use std::time::{Duration, Instant};
 
+use super::eur;
 use crate::model::{Dish, DishInput, PizzaSize, Supplier, Category};
 use crate::services::{admin_users, dishes, suppliers, categories};
 
@@ -10,6 +12,10 @@ enum AdminPage { Menu, Suppliers, Dishes, Categories, Orders, Settings }
 pub struct AdminState {
     page: AdminPage,
 
+    // true = es gibt einen Admin; spart count_documents pro Frame,
+    // wird nach einem Backup-Import zurückgesetzt
+    has_admin_user: bool,
+
     supplier_name: String,
     supplier_fee: i64,
     edit_supplier_id: Option<ObjectId>,
@@ -45,12 +51,17 @@ pub struct AdminState {
 
     pub set_supplier_idx: usize,
 
+    // Cache für settings::get_active_supplier_id (None = neu laden)
+    active_supplier_id: Option<ObjectId>,
+    pub active_supplier_at: Option<Instant>,
+
     backup_pass: String,
     backup_export_path: String,
     backup_import_path: String,
     backup_msg: Option<(bool, String)>,
 
     pub orders: Vec<crate::model::Order>,
+    pub orders_total_cents: i64,
     pub orders_paid_inputs: std::collections::HashMap<ObjectId, i64>,
     pub orders_needs_reload: bool,
 }
@@ -60,6 +71,8 @@ impl Default for AdminState {
         Self {
             page: AdminPage::Menu,
 
+            has_admin_user: false,
+
             supplier_name: String::new(),
             supplier_fee: 0,
             edit_supplier_id: None,
@@ -95,23 +108,23 @@ impl Default for AdminState {
 
             set_supplier_idx: 0,
 
+            active_supplier_id: None,
+            active_supplier_at: None,
+
             backup_pass: String::new(),
-            backup_export_path: "backup.json.enc".to_string(),
+            backup_export_path: "backup.bdk.enc".to_string(),
             backup_import_path: String::new(),
             backup_msg: None,
 
             orders: vec![],
+            orders_total_cents: 0,
             orders_paid_inputs: std::collections::HashMap::new(),
             orders_needs_reload: true,
         }
     }
 }
 
-fn eur(cents: i64) -> String {
-    let sign = if cents < 0 { "-" } else { "" };
-    let abs = cents.abs();
-    format!("{sign}€{}.{}", abs / 100, format!("{:02}", abs % 100))
-}
+const ACTIVE_SUPPLIER_TTL: Duration = Duration::from_secs(30);
 
 pub fn render(
     ui: &mut egui::Ui,
@@ -122,8 +135,10 @@ pub fn render(
     authed: &mut bool,
     state: &mut AdminState,
 ) {
-    let need_bootstrap = rt.block_on(admin_users::count(db)).unwrap_or(0) == 0;
-    if need_bootstrap {
+    if !state.has_admin_user {
+        state.has_admin_user = rt.block_on(admin_users::count(db)).unwrap_or(0) > 0;
+    }
+    if !state.has_admin_user {
         ui.heading("Create first admin user");
         ui.label("Username");
         ui.text_edit_singleline(user);
@@ -131,7 +146,7 @@ pub fn render(
         ui.add(egui::TextEdit::singleline(pass).password(true));
         if ui.button("Create admin").clicked() {
             match rt.block_on(admin_users::create(db, user, pass)) {
-                Ok(_) => { *authed = true; pass.clear(); }
+                Ok(_) => { *authed = true; state.has_admin_user = true; pass.clear(); }
                 Err(e) => { ui.colored_label(egui::Color32::RED, e.to_string()); }
             };
         }
@@ -177,6 +192,26 @@ pub fn render(
         });
 }
 
+/// Active supplier with a short TTL, so pages rendered every frame don't
+/// query the settings collection each time. The settings watcher resets
+/// `active_supplier_at` to force a reload.
+fn active_supplier_id(
+    rt: &tokio::runtime::Runtime,
+    db: &crate::db::Db,
+    state: &mut AdminState,
+) -> Option<ObjectId> {
+    use crate::services::settings;
+
+    let fresh = state
+        .active_supplier_at
+        .is_some_and(|t| t.elapsed() < ACTIVE_SUPPLIER_TTL);
+    if !fresh {
+        state.active_supplier_id = rt.block_on(settings::get_active_supplier_id(db)).ok().flatten();
+        state.active_supplier_at = Some(Instant::now());
+    }
+    state.active_supplier_id
+}
+
 /* ---------------- Suppliers ---------------- */
 
 fn page_suppliers(
@@ -261,16 +296,6 @@ fn page_suppliers(
 
 /* ---------------- Dishes (Create + Edit) ---------------- */
 
-fn parse_nr_key(nr_opt: &Option<String>) -> i64 {
-    if let Some(nr) = nr_opt {
-        let digits: String = nr.chars().filter(|c| c.is_ascii_digit()).collect();
-        if !digits.is_empty() {
-            if let Ok(x) = digits.parse::<i64>() { return x; }
-        }
-    }
-    i64::MAX
-}
-
 fn row_label(d: &Dish) -> String {
     if d.tags.iter().any(|t| t == "Pizza") {
         let nr = d.number.clone().unwrap_or_default();
@@ -409,7 +434,7 @@ fn page_dishes(
     ui.label("Existing dishes");
 
     let mut dlist = rt.block_on(dishes::list_by_supplier(db, sid)).unwrap_or_default();
-    dlist.sort_by_key(|d| parse_nr_key(&d.number));
+    dlist.sort_by_key(|d| d.number_key().unwrap_or(i64::MAX));
 
     for d in dlist {
         ui.horizontal(|ui| {
@@ -648,12 +673,12 @@ fn page_orders(
     db: &crate::db::Db,
     state: &mut AdminState,
 ) {
-    use crate::services::{orders, settings};
+    use crate::services::orders;
 
     ui.heading("Orders");
 
     // aktiven Lieferanten ermitteln
-    let active = rt.block_on(settings::get_active_supplier_id(db)).ok().flatten();
+    let active = active_supplier_id(rt, db, state);
     let Some(sid) = active else {
         ui.colored_label(egui::Color32::YELLOW, "No active supplier set in Settings.");
         return;
@@ -661,7 +686,8 @@ fn page_orders(
 
     // Bei Erstaufruf oder wenn Watcher anschlägt -> neu laden
     if state.orders_needs_reload || state.orders.is_empty() {
-        state.orders = rt.block_on(orders::list_by_supplier(db, sid)).unwrap_or_default();
+        (state.orders, state.orders_total_cents) =
+            rt.block_on(orders::list_with_total(db, sid)).unwrap_or_default();
         state.orders_needs_reload = false;
 
         // Eingabepuffer für „paid“
@@ -681,7 +707,6 @@ fn page_orders(
         return;
     }
 
-    let mut total_all_cents: i64 = 0;
     let mut to_delete: Vec<ObjectId> = Vec::new();
     // lokale Updates sammeln (id, paid, completed)
     let mut pending_updates: Vec<(ObjectId, i64, bool)> = Vec::new();
@@ -694,7 +719,6 @@ fn page_orders(
             let items_sum: i64 = o.items.iter().map(|it| it.line_total_cents).sum();
             items_sum + o.delivery_fee_cents
         };
-        total_all_cents += order_total;
 
         // Pufferwert für "Cash received"
         let paid_buf = state
@@ -737,6 +761,10 @@ fn page_orders(
             ui.monospace(format!("Delivery fee: {}", eur(o.delivery_fee_cents)));
             ui.separator();
             ui.monospace(format!("Order total: {}", eur(order_total)));
+            // Name zum Bestellzeitpunkt (Snapshot), nicht zwingend der aktuelle
+            if let Some(name) = &o.supplier_name {
+                ui.small(format!("Ordered from: {name}"));
+            }
 
             // Zahlung
             ui.separator();
@@ -797,12 +825,11 @@ fn page_orders(
 
     // Löschungen ausführen
     if !to_delete.is_empty() {
-        for id in &to_delete {
-            let _ = rt.block_on(orders::delete(db, *id));
-        }
+        let _ = rt.block_on(orders::delete_many(db, &to_delete));
         // reload nach Löschungen
         state.orders_needs_reload = true;
-        state.orders = rt.block_on(orders::list_by_supplier(db, sid)).unwrap_or_default();
+        (state.orders, state.orders_total_cents) =
+            rt.block_on(orders::list_with_total(db, sid)).unwrap_or_default();
         // Puffer neu setzen
         state
             .orders_paid_inputs
@@ -817,7 +844,7 @@ fn page_orders(
     }
 
     ui.separator();
-    ui.heading(format!("Sum over all orders: {}", eur(total_all_cents)));
+    ui.heading(format!("Sum over all orders: {}", eur(state.orders_total_cents)));
 }
 
 /* ---------------- Settings ---------------- */
@@ -835,7 +862,7 @@ fn page_settings(
     if sups.is_empty() { ui.label("No suppliers yet. Create one first."); return; }
     if state.set_supplier_idx >= sups.len() { state.set_supplier_idx = 0; }
 
-    let active = rt.block_on(settings::get_active_supplier_id(db)).ok().flatten();
+    let active = active_supplier_id(rt, db, state);
     if let Some(a) = active {
         ui.label(format!("Active supplier: {}", id_to_name(&sups, a)));
     } else {
@@ -852,6 +879,7 @@ fn page_settings(
     if ui.button("Set active").clicked() {
         let sid = sups[state.set_supplier_idx].id.unwrap();
         let _ = rt.block_on(settings::set_active_supplier(db, sid));
+        state.active_supplier_at = None;
     }
 
     ui.separator();
@@ -893,7 +921,11 @@ fn page_settings(
                     state.backup_import_path.trim(),
                     state.backup_pass.trim(),
                 )) {
-                    Ok(_) => state.backup_msg = Some((true, "Import erfolgreich (DB ersetzt).".into())),
+                    Ok(_) => {
+                        // admin_users wurde ersetzt -> Bootstrap-Check neu machen
+                        state.has_admin_user = false;
+                        state.backup_msg = Some((true, "Import erfolgreich (DB ersetzt).".into()));
+                    }
                     Err(e) => state.backup_msg = Some((false, format!("Import fehlgeschlagen: {e}"))),
                 }
             }
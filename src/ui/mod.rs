@@ -7,6 +7,12 @@ pub mod admin;
 pub enum UiTab { Order, Admin }
 impl Default for UiTab { fn default() -> Self { UiTab::Order } }
 
+pub(crate) fn eur(cents: i64) -> String {
+    let sign = if cents < 0 { "-" } else { "" };
+    let abs = cents.abs();
+    format!("{sign}€{}.{:02}", abs / 100, abs % 100)
+}
+
 pub fn render_order(
     ui: &mut egui::Ui,
     rt: &tokio::runtime::Runtime,
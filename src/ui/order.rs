@@ -1,7 +1,8 @@
 use eframe::egui;
 use mongodb::bson::oid::ObjectId;
 
-use crate::model::{Dish, Category};
+use super::eur;
+use crate::model::{Dish, Category, OrderItem};
 use crate::services::{dishes, orders, settings, suppliers, categories};
 
 #[derive(Clone)]
@@ -23,6 +24,10 @@ pub struct OrderState {
     pub categories: Vec<Category>,
     pub selected_category: Option<ObjectId>, // None = "Alle"
 
+    // Indizes in `dishes` für die gewählte Kategorie; None = veraltet
+    filtered_idx: Vec<usize>,
+    filtered_for: Option<Option<ObjectId>>,
+
     pub(crate) selections: Vec<ItemSel>,
     pub customer_name: String,
     pub client_id: String,
@@ -44,20 +49,11 @@ impl OrderState {
     }
 }
 
-fn eur(cents: i64) -> String {
-    let sign = if cents < 0 { "-" } else { "" };
-    let abs = cents.abs();
-    format!("{sign}€{}.{}", abs / 100, format!("{:02}", abs % 100))
-}
-
 fn dish_sort_key(d: &Dish) -> (i32, i64, String) {
-    if let Some(nr) = &d.number {
-        let digits: String = nr.chars().filter(|c| c.is_ascii_digit()).collect();
-        if let Ok(v) = digits.parse::<i64>() {
-            return (0, v, d.name.clone());
-        }
+    match d.number_key() {
+        Some(v) => (0, v, d.name.clone()),
+        None => (1, i64::MAX, d.name.clone()),
     }
-    (1, i64::MAX, d.name.clone())
 }
 
 fn dish_label(d: &Dish) -> String {
@@ -97,13 +93,14 @@ pub fn render(
         });
         match res {
             Ok((sid, name, fee, mut ds, cats)) => {
-                ds.sort_by_key(dish_sort_key);
+                ds.sort_by_cached_key(dish_sort_key);
 
                 state.supplier_id = sid;
                 state.supplier_name = name;
                 state.delivery_fee_cents = fee;
                 state.dishes = ds;
                 state.categories = cats;
+                state.filtered_for = None;
                 // selected_category bleibt None => "Alle"
 
                 if state.selections.is_empty() {
@@ -182,19 +179,25 @@ pub fn render(
         ui.separator();
         ui.label("Dishes");
 
+        // Gefilterte Liste nach gewählter Kategorie: nur neu bauen, wenn sich
+        // Kategorie oder Menü geändert haben, nicht pro Zeile und Frame
+        if state.filtered_for != Some(state.selected_category) {
+            state.filtered_idx = state
+                .dishes
+                .iter()
+                .enumerate()
+                .filter(|(_, d)| match state.selected_category {
+                    None => true,
+                    Some(cat) => d.categories.iter().any(|x| *x == cat),
+                })
+                .map(|(idx, _)| idx)
+                .collect();
+            state.filtered_for = Some(state.selected_category);
+        }
+        let filtered = &state.filtered_idx;
+
         for (i, sel) in state.selections.iter_mut().enumerate() {
             ui.push_id(i, |ui| {
-                // Gefilterte Liste nach gewählter Kategorie
-                let filtered: Vec<(usize, &Dish)> = state
-                    .dishes
-                    .iter()
-                    .enumerate()
-                    .filter(|(_, d)| match state.selected_category {
-                        None => true,
-                        Some(cat) => d.categories.iter().any(|x| *x == cat),
-                    })
-                    .collect();
-
                 ui.group(|ui| {
                     // Falls die Kategorie leer ist
                     if filtered.is_empty() {
@@ -202,31 +205,21 @@ pub fn render(
                         return;
                     }
 
-                    // Build filtered list by category
-                    let filtered: Vec<(usize, &Dish)> = state
-                        .dishes
-                        .iter()
-                        .enumerate()
-                        .filter(|(_, d)| match state.selected_category {
-                            None => true,
-                            Some(cat) => d.categories.iter().any(|x| *x == cat),
-                        })
-                        .collect();
-
                     // Make sure current selection is always in the options,
                     // even if it doesn't match the filter.
-                    let mut options: Vec<(usize, &Dish)> = filtered.clone();
+                    let mut options: Vec<(usize, &Dish)> =
+                        filtered.iter().map(|&idx| (idx, &state.dishes[idx])).collect();
 
                     let current_idx_ok = sel.dish_idx < state.dishes.len();
                     if current_idx_ok {
-                        let cur_in_filter = filtered.iter().any(|(idx, _)| *idx == sel.dish_idx);
+                        let cur_in_filter = filtered.contains(&sel.dish_idx);
                         if !cur_in_filter {
                             // Prepend current dish so it stays selectable/visible
                             options.insert(0, (sel.dish_idx, &state.dishes[sel.dish_idx]));
                         }
                     } else {
                         // Safety: if dish index became invalid (menu changed), fall back to first filtered (if any)
-                        if let Some((first_idx, _)) = filtered.first() {
+                        if let Some(first_idx) = filtered.first() {
                             sel.dish_idx = *first_idx;
                             sel.size_idx = None;
                         }
@@ -322,74 +315,49 @@ pub fn render(
 
         if ui.add_enabled(can_submit, egui::Button::new("Submit order")).clicked() {
             if let Some(supplier_id) = state.supplier_id {
-                let items: Vec<(ObjectId, String, i32, i64, Option<String>, Option<String>)> = state
-                    .selections
-                    .iter()
-                    .map(|s| {
-                        let d = &state.dishes[s.dish_idx];
-                        if let Some(sizes) = &d.pizza_sizes {
-                            let idx = s.size_idx.unwrap_or(0).min(sizes.len().saturating_sub(1));
-                            let sz = &sizes[idx];
-                            let nr = d.number.clone().unwrap_or_default();
-                            let base = if nr.is_empty() {
-                                d.name.clone()
-                            } else {
-                                format!("Nr. {}: {}", nr, d.name)
-                            };
-                            let name = format!("{} ({})", base, sz.label);
-                            (
-                                d.id.unwrap(),
-                                name,
-                                s.qty,
-                                sz.price_cents as i64,
-                                if s.note.trim().is_empty() { None } else { Some(s.note.clone()) },
-                                Some(sz.label.clone()),
-                            )
-                        } else {
-                            let nr = d.number.clone().unwrap_or_default();
-                            let base = if nr.is_empty() {
-                                d.name.clone()
-                            } else {
-                                format!("Nr. {}: {}", nr, d.name)
-                            };
-                            (
-                                d.id.unwrap(),
-                                base,
-                                s.qty,
-                                d.price_cents as i64,
-                                if s.note.trim().is_empty() { None } else { Some(s.note.clone()) },
-                                None,
-                            )
-                        }
-                    })
-                    .collect();
-
-                let mut lines: Vec<String> = Vec::new();
+                // Ein Durchlauf: DB-Items und Zeilen für die Erfolgsmeldung
+                let mut items: Vec<OrderItem> = Vec::with_capacity(state.selections.len());
+                let mut lines: Vec<String> = Vec::with_capacity(state.selections.len());
                 for s in &state.selections {
                     let d = &state.dishes[s.dish_idx];
-                    let nr = d.number.clone().unwrap_or_default();
+                    let nr = d.number.as_deref().unwrap_or_default();
                     let base = if nr.is_empty() {
                         d.name.clone()
                     } else {
                         format!("Nr. {}: {}", nr, d.name)
                     };
 
-                    let (unit_cents, size_hint) = if let Some(sizes) = &d.pizza_sizes {
+                    let (unit_cents, size_label) = if let Some(sizes) = &d.pizza_sizes {
                         let idx = s.size_idx.unwrap_or(0).min(sizes.len().saturating_sub(1));
                         (sizes[idx].price_cents as i64, Some(sizes[idx].label.clone()))
                     } else {
                         (d.price_cents as i64, None)
                     };
+                    let note = s.note.trim();
 
-                    let mut line = if let Some(sz) = size_hint {
+                    let mut line = if let Some(sz) = &size_label {
                         format!("x{}  {} ({}) – {}", s.qty, base, sz, eur(unit_cents))
                     } else {
                         format!("x{}  {} – {}", s.qty, base, eur(unit_cents))
                     };
-                    if !s.note.trim().is_empty() {
-                        line.push_str(&format!("  · Note: {}", s.note.trim()));
+                    if !note.is_empty() {
+                        line.push_str(&format!("  · Note: {}", note));
                     }
                     lines.push(line);
+
+                    let name = match &size_label {
+                        Some(sz) => format!("{} ({})", base, sz),
+                        None => base,
+                    };
+                    items.push(OrderItem {
+                        dish_id: d.id.unwrap(),
+                        name,
+                        qty: s.qty,
+                        unit_price_cents: unit_cents,
+                        line_total_cents: 0, // setzt orders::create_with_notes
+                        note: if note.is_empty() { None } else { Some(s.note.clone()) },
+                        variant: size_label,
+                    });
                 }
                 let total_cents = grand_total;
 
@@ -397,6 +365,7 @@ pub fn render(
                     db,
                     &state.customer_name,
                     supplier_id,
+                    &state.supplier_name,
                     items,
                     state.delivery_fee_cents,
                     &state.client_id,